@@ -19,25 +19,31 @@ Released under the WTFPL (Do What The Fuck You Want To Public License)
 
 import sys
 import os
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
 import configparser
+import io
 import re
 import base64
-import io
-import ctypes
 import tempfile
 import argparse
+import threading
+import time
+import codecs
+import hashlib
+import shutil
+from collections import OrderedDict
 
-# Check for required dependencies
-try:
-    import fitz  # PyMuPDF
-except ImportError:
+REQUIRED_PACKAGES = "PyMuPDF PyQt6"
+
+
+def exit_missing_dependency(name):
+    """Explain how to install the required packages and exit"""
     print("\n" + "="*60)
-    print("ERROR: PyMuPDF (fitz) is not installed.")
-    print("\nYou need to install PyMuPDF, PyQt6, and screeninfo.")
+    print(f"ERROR: {name} is not installed.")
+    print("\nYou need to install PyMuPDF and PyQt6.")
     print("Please enter these commands:\n")
-    commands = "pip install PyMuPDF PyQt6 screeninfo"
+    commands = f"pip install {REQUIRED_PACKAGES}"
     print(f"  {commands}\n")
     print("="*60)
     
@@ -50,67 +56,73 @@ except ImportError:
     
     sys.exit(1)
 
-try:
-    from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
-                                  QHBoxLayout, QLabel, QPushButton, QFileDialog,
-                                  QTextEdit, QFrame, QMessageBox)
-    from PyQt6.QtCore import Qt, QTimer, QSize, QPoint, pyqtSignal, QPointF
-    from PyQt6.QtGui import QPixmap, QImage, QKeySequence, QShortcut, QScreen, QPainter, QColor, QPen, QRadialGradient, QMouseEvent, QIcon
-except ImportError:
-    print("\n" + "="*60)
-    print("ERROR: PyQt6 is not installed.")
-    print("\nYou need to install PyMuPDF, PyQt6, and screeninfo.")
-    print("Please enter these commands:\n")
-    commands = "pip install PyMuPDF PyQt6 screeninfo"
-    print(f"  {commands}\n")
-    print("="*60)
-    
+
+# PyMuPDF is only imported once the command line has been parsed (see
+# import_pymupdf), so that --help does not have to load MuPDF
+fitz = None
+
+
+def import_pymupdf():
+    """Import PyMuPDF into the module namespace, exiting if it is missing"""
+    global fitz
     try:
-        import pyperclip
-        pyperclip.copy(commands)
-        print("The commands have been copied to your clipboard.\n")
-    except:
-        pass
-    
-    sys.exit(1)
+        import fitz  # PyMuPDF
+    except ImportError:
+        exit_missing_dependency("PyMuPDF (fitz)")
+
 
 try:
-    from screeninfo import get_monitors
+    from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
+                                  QHBoxLayout, QLabel, QPushButton, QFileDialog,
+                                  QTextEdit, QFrame, QMessageBox, QSizePolicy)
+    from PyQt6.QtCore import Qt, QObject, QTimer, QPoint, QPointF, QSize, pyqtSignal, QRunnable, QThreadPool, QBuffer, QByteArray, QIODevice, QStandardPaths
+    from PyQt6.QtGui import QPixmap, QImage, QKeySequence, QShortcut, QPainter, QColor, QRadialGradient, QIcon, QImageReader, QPixmapCache
+    from PyQt6 import sip
 except ImportError:
-    print("\n" + "="*60)
-    print("ERROR: screeninfo is not installed.")
-    print("\nYou need to install PyMuPDF, PyQt6, and screeninfo.")
-    print("Please enter these commands:\n")
-    commands = "pip install PyMuPDF PyQt6 screeninfo"
-    print(f"  {commands}\n")
-    print("="*60)
-    
-    try:
-        import pyperclip
-        pyperclip.copy(commands)
-        print("The commands have been copied to your clipboard.\n")
-    except:
-        pass
-    
-    sys.exit(1)
+    exit_missing_dependency("PyQt6")
     
 icon_base64 = "AAABAAMAEBAAAAAAIACQAgAANgAAABgYAAAAACAA+AMAAMYCAAAgIAAAAAAgAPwAAAC+BgAAiVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAIAAACQkWg2AAACV0lEQVR4nH2STU9TURCGZ849p/e0t7UUpNFipC4wiEblo2ATKkYXxrhgJfEHaICf4MKt/gQT90RJ2EJiSIw1Rt0ICxJhgW2qRlNFKKW39/Z+zLhoAVe+y3ln8maeGVxdXfU8DwEA4X9iYACllFxYWFhaWjIMww/CIxeFAAAmOqooaYRhOD09LZm5YdsGgBTA3LEDYgCQohOKCC2CEICZ5fzc7O9aHT9/fHT3+q8DWxqCfD+TvwkAPz68FkoFIaUT1tPlt3wxPz83K7XWUikUkNDKDXTQqA3ee9h94Qoips/0by0+jyW6ElpJAayU1loSETMDQ0AcMnstN9qX/bn2PvS81MClIAwQMGi3MBOROF4UAAAiVqK8sohC9Axe3i9tku+FbhPomIf8F53fbJhWHA3j9MQNneqtlbbO3Zlx9vfkznc+BCIPOSAT9QwNd2fPn8oVQs8rLb+MpTMyGotl+nkbyfcNxM4AGoZT2x24P7sXsL/3p7rxafPFMwAwT3SZqZP27k5PRIiI2Q6R7Ssmk0ksbUST6fDbdv3LZl8mg1IhBaFbj8WjmVSXFZF2O4EB2G+9K1cfPH5SOzhQpskorHgcGOymLaUiokTUfLP1NTcwBoDStpuF/DWtdTMgE9H3/XS6t1gsAsDUrdvValVKWQcoDOVzI1ftZlO6rjsyOjpZmDQQiVhH9fraevHVCgBMjY8Njwy7jisEhsyO4zqOIxHRcRzHcQCAiCzLKlcqufEJAChXKmezWdu2hRBtkkII7Lw3dv6MiOLxuGmaANBqtRqNRrv7SH8BIVsdsBkYkMQAAAAASUVORK5CYIKJUE5HDQoaCgAAAA1JSERSAAAAGAAAABgIAgAAAG8Vqq8AAAO/SURBVHicnZVLaJxVFMfPOfd+88pkOjPJmC+j0WaSIM2jVCxWiwqGWLBiJYpuzKrqQhdZpSK4K5idC1+48BEsRRCLom4G1LEIsVDEKqSppc3DdNrMo1PD5JtvJnPvd4+LSdtJaoLt3d3H+d17/+eF09PTkUiEmRERbn80DMvlssxms+l0moiMMXcAahiOjIzIbDY7NTV1B4jm0dfXR40fWVKikLdrj0JaUgIAIkrbtl8+fPib775nZ+WFfUNuXREiAyMgMwOwdisAIEMtAIjXtwxzyGd99ftfGI6OPvuMbdvStu0jExMnfz1FuvLmk3uLq1VJCAAMTEJ6a7U9r70FAH989LbwB4ynERAAtOFEa/Dn2TnT3v7GkYn5hb9JKZUvFLTWmjlXdouOW3DcoltbvlqqxZNDk8eclpjTEhuaPFaLJ5evlopureC4RcfNlV3NrLXO5QtKKYmIUkpERABLkCQShEjERJLQHwye/vAoAD42+YkklESSiAEQ2BKEAIhoSYmItLWUjEQAIHwBFMJoBczbCL+lp5CErlZX5s6F7Lt9LRGSlvAHEAlJNJzwf0Fk+cuLF354ffSpz9LBto6zn7+7emnBqLqqrCIJviUNNoGYhAQ29fKKP9Ye639g78Rki90FCB0PPprY/ZDRdQC89Et6ZWluOxCSqP6zHIq1dT78RLRnV2tXKn7/7kr+cn11JdiWKPx5ulrKs+d1H3jOKeVzJz5ulrgJhOit1XYeGI10dumqq6tuafZMafbMlVM/VXKX2VM9h8bCnfcCwNnjH5SvLCWTSWbzHyBEUm5lz4uvCqJvn9/39Bcnzdpa+pWDka5UIJ5AgMX0CaMVA/gjMf+OOG9M8psgZgbLtzT9Y/SenY+/c/y394+WFy+E7+vVWoOnAUC0RgUiABjP85Ty/BbfCkJEi7DzrsTy158WwSCRz/IndrQCorEIAIiaI87yDLe3hnxC1K+7T0IjJLQ6f805+N6XyjQqHLNhAGbmYDAIANVqtbnyMYPPEuevOd1RxYAAIBFRaz3Q3x8IBGra46bwZcNENHvxIgB09/Z6xiDdZNURd3WInlRKa42ImMlkXNcNh8NSStpwJyNiKpUaHh4GgEwmMz8/v6kiG2atdaVSQcT1suQ4TvNbjDGhUGhmZualsbGFhQUAeGT//vHx8cHBQdd1m/VCxMZ0XeyNWgIiCiGklMaYgYEBAHAcR0ophBBCbDq8bpLJZDYJeeNrlmWFw+FGUyAix3GUUls1m62zH1EpVSqVbqwQ0TYt618cSruH/B5igQAAAABJRU5ErkJggolQTkcNChoKAAAADUlIRFIAAAAgAAAAIAgCAAAA/BjtowAAAMNJREFUeJzVlTEOgzAMRT8VR6NLtnKMch56DLp5gcGnyswQqbIaNdiBUPInGPwf3zhxw8woqVtRdwAomoCIiieoH9Aws/cegHMOwPx87HS8v94AiCi82hJ049SNk6mk1Vt/PS9Drym0JViGXumbCchQ/QDtTw6tt46QARDDDgbEY6pEbgN+tUWaJk5GCiDLYgsJNidIW2+aSv11TE13jg2w01Tq9BaFdXGgTlyZGoW1+lmHGl0mQfh2KWWOyyTIVv0rcwUKMFd7xml36wAAAABJRU5ErkJggg=="
 
-def create_icon_from_base64(base64_string):
-    """Create a QIcon from Base64-encoded ICO data."""
+_icon_file_path = None
+
+
+def decode_icon_data(base64_string):
+    """Decode Base64-encoded ICO data, tolerating missing padding."""
     base64_string += '=' * ((4 - len(base64_string) % 4) % 4)
-    icon_data = base64.b64decode(base64_string)
+    return base64.b64decode(base64_string)
+
+
+def create_icon_from_base64(base64_string):
+    """Create a QIcon from Base64-encoded ICO data without touching the disk."""
+    buffer = QBuffer()
+    buffer.setData(QByteArray(decode_icon_data(base64_string)))
+    buffer.open(QIODevice.OpenModeFlag.ReadOnly)
+    
+    # Keep every resolution stored in the ICO, not just the first one
+    reader = QImageReader(buffer, b'ico')
+    icon = QIcon()
+    for index in range(max(1, reader.imageCount())):
+        reader.jumpToImage(index)
+        image = reader.read()
+        if not image.isNull():
+            icon.addPixmap(QPixmap.fromImage(image))
+    return icon
 
-    temp_icon_path = tempfile.mktemp(suffix='.ico')
-    with open(temp_icon_path, 'wb') as f:
-        f.write(icon_data)
 
-    return QIcon(temp_icon_path), temp_icon_path
+def write_icon_file(base64_string):
+    """Write the icon to a temporary .ico file once and return its path."""
+    global _icon_file_path
+    if _icon_file_path is None:
+        fd, _icon_file_path = tempfile.mkstemp(suffix='.ico')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(decode_icon_data(base64_string))
+    return _icon_file_path
 
 
 def set_windows_taskbar_icon(temp_icon_path, window_title, app_id="PDFsat.App.1.0"):
     """Set the Windows taskbar icon from a file."""
     if sys.platform.startswith('win'):
+        import ctypes
         ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(app_id)
 
         hwnd = ctypes.windll.user32.FindWindowW(None, window_title)
@@ -127,141 +139,749 @@ def set_windows_taskbar_icon(temp_icon_path, window_title, app_id="PDFsat.App.1.
 
 def set_app_icon(app, window):
     """Set application and taskbar icons properly."""
-    icon, temp_icon_path = create_icon_from_base64(icon_base64)
+    icon = create_icon_from_base64(icon_base64)
     app.setWindowIcon(icon)
     window.setWindowIcon(icon)
 
-    # Match the exact window title used in PresenterWindow
-    set_windows_taskbar_icon(temp_icon_path, "PDF Show and Tell - Presenter View")
+    # LoadImageW() can only load icons from a file
+    temp_icon_path = None
+    if sys.platform.startswith('win'):
+        temp_icon_path = write_icon_file(icon_base64)
+        # Match the exact window title used in PresenterWindow
+        set_windows_taskbar_icon(temp_icon_path, "PDF Show and Tell - Presenter View")
     return temp_icon_path
 
 
 
+def advise_readahead(path):
+    """Ask the OS to start reading a file into the page cache (POSIX only)"""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+
+def scale_pixmap(pixmap, size):
+    """Scale a pixmap to fit size, reusing earlier results from QPixmapCache
+    
+    size is in device-independent pixels; the pixmap's device pixel ratio
+    is kept, so HiDPI slides stay sharp.
+    """
+    # Slides rendered for the presentation screen already fit it, give or
+    # take MuPDF's rounding; resampling those would only blur them
+    ratio = pixmap.devicePixelRatio()
+    size = QSize(round(size.width() * ratio), round(size.height() * ratio))
+    fitted = pixmap.size().scaled(size, Qt.AspectRatioMode.KeepAspectRatio)
+    if (pixmap.width() <= size.width() and pixmap.height() <= size.height() and
+            fitted.width() - pixmap.width() <= 1 and fitted.height() - pixmap.height() <= 1):
+        return pixmap
+    
+    # cacheKey() identifies the pixel data, so a re-rendered slide never
+    # picks up a stale scaled copy
+    key = f"pdfsat:{pixmap.cacheKey()}:{size.width()}x{size.height()}"
+    cached = QPixmapCache.find(key)
+    if cached:
+        return cached
+    
+    # scaled() works in device pixels and keeps the device pixel ratio
+    scaled = pixmap.scaled(size, Qt.AspectRatioMode.KeepAspectRatio,
+                           Qt.TransformationMode.SmoothTransformation)
+    QPixmapCache.insert(key, scaled)
+    return scaled
+
+
+def set_label_pixmap(label, pixmap):
+    """Set a label's pixmap unless it already shows exactly that pixmap"""
+    if label.pixmap().cacheKey() != pixmap.cacheKey():
+        label.setPixmap(pixmap)
+
+
+def set_label_text(label, text):
+    """Set a label's text unless it already shows exactly that text"""
+    if label.text() != text:
+        label.setText(text)
+
+
 class Config:
     """Handle configuration persistence"""
     def __init__(self):
-        self.config_file = Path.home() / '.pdfsat.ini'
-        self.config = configparser.ConfigParser()
+        self.home_dir = str(Path.home())
+        self.config_file = Path(self.home_dir) / '.pdfsat.ini'
+        # Values are plain strings; interpolation would only make every get()
+        # slower and reject paths containing '%'
+        self.config = configparser.ConfigParser(interpolation=None)
+        # Whether there are changes that have not been saved yet
+        self.dirty = False
+        # Background writes may finish out of order; only the newest one
+        # is allowed to reach the file
+        self._write_lock = threading.Lock()
+        self._saves = 0
+        self._written = 0
         self.load()
     
     def load(self):
         if self.config_file.exists():
             self.config.read(self.config_file)
     
-    def save(self):
-        with open(self.config_file, 'w') as f:
-            self.config.write(f)
+    def save(self, background=False):
+        """Write the settings if anything changed
+        
+        With background, the file is written on the global thread pool. The
+        contents are captured here, so later set() calls don't race the write.
+        """
+        if not self.dirty:
+            return
+        buffer = io.StringIO()
+        self.config.write(buffer)
+        self.dirty = False
+        self._saves += 1
+        save_number = self._saves
+        if background:
+            QThreadPool.globalInstance().start(lambda: self._write(buffer.getvalue(), save_number))
+        else:
+            self._write(buffer.getvalue(), save_number)
+    
+    def _write(self, text, save_number):
+        with self._write_lock:
+            if save_number < self._written:
+                return
+            try:
+                self.config_file.write_text(text)
+                self._written = save_number
+            except OSError as e:
+                print(f"Could not save settings to {self.config_file}: {e}")
     
     def get(self, section, key, fallback=None):
         return self.config.get(section, key, fallback=fallback)
     
     def set(self, section, key, value):
+        value = str(value)
+        if self.get(section, key) == value:
+            return
         if not self.config.has_section(section):
             self.config.add_section(section)
-        self.config.set(section, key, str(value))
+        self.config.set(section, key, value)
+        self.dirty = True
+
+
+class DiskCache:
+    """Keep rendered slides on disk so reopening a PDF shows them instantly
+    
+    Images are stored as <cache dir>/slides/<document key>/v<VERSION>/<variant>/<page>.png,
+    where variant names the render size. The document key hashes the PDF's
+    path, size and modification time, so an edited PDF never shows stale
+    slides. Writing happens on the global thread pool. Once the cache
+    exceeds MAX_BYTES, the least recently used documents and render sizes
+    are removed; this is checked on opening and after every PRUNE_INTERVAL
+    bytes written. All disk errors are ignored; the cache is only an
+    accelerator.
+    """
+    VERSION = 1
+    MAX_BYTES = 512 * 1024 * 1024
+    PRUNE_INTERVAL = MAX_BYTES // 8
+    # Only directories named like this were created here and may be deleted
+    DOC_KEY_RE = re.compile(r'[0-9a-f]{40}')
+    
+    def __init__(self, pdf_path, root=None):
+        if root is None:
+            root = Path(QStandardPaths.writableLocation(
+                QStandardPaths.StandardLocation.CacheLocation)) / 'slides'
+        self.root = Path(root)
+        stat = os.stat(pdf_path)
+        ident = f"{os.path.abspath(pdf_path)}|{stat.st_size}|{stat.st_mtime_ns}"
+        self.doc_root = self.root / hashlib.sha1(ident.encode('utf-8')).hexdigest()
+        self.doc_dir = self.doc_root / f"v{self.VERSION}"
+        # Guards _pending (paths queued for writing) and _unpruned_bytes
+        self._lock = threading.Lock()
+        self._pending = set()
+        self._unpruned_bytes = 0
+        self._prune_lock = threading.Lock()
+        
+        # Mark this document as recently used, then trim the cache. Render
+        # sizes touched since then are in use (see prune); the time is taken
+        # from the file system so that both have the same resolution
+        self._opened = time.time()
+        try:
+            self.doc_dir.mkdir(parents=True, exist_ok=True)
+            os.utime(self.doc_root)
+            self._opened = self.doc_root.stat().st_mtime
+        except OSError:
+            pass
+        QThreadPool.globalInstance().start(self.prune)
+    
+    def _path(self, page_num, variant):
+        return self.doc_dir / variant / f"{page_num}.png"
+    
+    def contains(self, page_num, variant):
+        """Whether an image for a page has been stored or is being written"""
+        path = self._path(page_num, variant)
+        with self._lock:
+            if path in self._pending:
+                return True
+        return path.exists()
+    
+    def remove_variant(self, variant):
+        """Delete all stored images of a render size, in the background"""
+        QThreadPool.globalInstance().start(
+            lambda: shutil.rmtree(self.doc_dir / variant, ignore_errors=True))
+    
+    def load(self, page_num, variant):
+        """Return the stored image for a page, or None"""
+        path = self._path(page_num, variant)
+        if not path.exists():
+            return None
+        image = QImage(str(path))
+        if image.isNull():
+            return None
+        # Render sizes in use are never pruned (see prune)
+        try:
+            os.utime(path.parent)
+        except OSError:
+            pass
+        return image
+    
+    def store(self, page_num, variant, image, background=True):
+        """Write an image for a page, by default in the background"""
+        path = self._path(page_num, variant)
+        with self._lock:
+            if path in self._pending:
+                return
+            self._pending.add(path)
+        if background:
+            QThreadPool.globalInstance().start(lambda: self._write(path, image))
+        else:
+            self._write(path, image)
+    
+    def _write(self, path, image):
+        size = 0
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write under a temporary name so readers never see partial files
+            temp_path = path.with_name(f"{path.stem}.{threading.get_ident()}.tmp")
+            if image.save(str(temp_path), 'PNG'):
+                os.replace(temp_path, path)
+                size = path.stat().st_size
+        except OSError:
+            pass
+        
+        with self._lock:
+            self._pending.discard(path)
+            self._unpruned_bytes += size
+            prune_due = self._unpruned_bytes >= self.PRUNE_INTERVAL
+            if prune_due:
+                self._unpruned_bytes = 0
+        if prune_due:
+            self.prune()
+    
+    @staticmethod
+    def _tree_size(directory):
+        """Total size of the files below a directory, skipping vanished ones"""
+        total = 0
+        # Unlike Path.rglob(), os.walk() ignores directories removed meanwhile
+        for dir_path, _, file_names in os.walk(directory):
+            for name in file_names:
+                try:
+                    total += os.stat(os.path.join(dir_path, name)).st_size
+                except OSError:
+                    # E.g. a .tmp file renamed by a concurrent write
+                    pass
+        return total
+    
+    def prune(self):
+        """Delete least recently used documents and render sizes beyond MAX_BYTES
+        
+        Other documents are removed as a whole. Of the open document, the
+        render sizes not used since it was opened may be removed too, so
+        sizes from earlier sessions cannot grow the cache without limit.
+        """
+        # One pass at a time is enough; concurrent ones would double count
+        if not self._prune_lock.acquire(blocking=False):
+            return
+        try:
+            try:
+                doc_roots = [path for path in self.root.iterdir()
+                             if path.is_dir() and self.DOC_KEY_RE.fullmatch(path.name)]
+            except OSError:
+                return
+            
+            total = 0
+            entries = []
+            for doc_root in doc_roots:
+                if doc_root != self.doc_root:
+                    candidates = [doc_root]
+                else:
+                    try:
+                        candidates = [path for path in self.doc_dir.iterdir() if path.is_dir()]
+                    except OSError:
+                        candidates = []
+                
+                for path in candidates:
+                    try:
+                        mtime = path.stat().st_mtime
+                    except OSError:
+                        continue
+                    size = self._tree_size(path)
+                    total += size
+                    # Never delete what the open document is showing right
+                    # now: loading or writing a slide touches its directory
+                    if doc_root != self.doc_root or mtime < self._opened:
+                        entries.append((mtime, size, path))
+            
+            for _, size, path in sorted(entries):
+                if total <= self.MAX_BYTES:
+                    break
+                shutil.rmtree(path, ignore_errors=True)
+                total -= size
+        finally:
+            self._prune_lock.release()
 
 
 class SlideCache:
-    """Cache rendered slides for performance"""
-    def __init__(self, pdf_path, dpi=150, fullscreen_dpi=300):
+    """Cache rendered slides for performance
+    
+    Slides are rendered once, at the pixel size of the presentation screen,
+    and the presenter panes get their own renders at pane size. The caches
+    are LRUs bounded in entries and bytes, so memory stays constant
+    regardless of the number of pages in the document or the screen
+    resolution. Slides can be prerendered from worker threads with
+    prefetch(). The MuPDF document is not thread-safe, so self.lock
+    serializes the MuPDF calls, and nothing else; the images parked by
+    workers are guarded by the short-held self.prefetch_lock, so the GUI
+    thread never waits for an unrelated render.
+    """
+    def __init__(self, pdf_path, target_size=None, dpi=300, max_entries=None,
+                 max_bytes=256 * 1024 * 1024, device_pixel_ratio=1.0):
+        """
+        Args:
+            pdf_path: Path to the PDF file
+            target_size: (width, height) in device pixels of the presentation
+                screen, or None to render at a fixed DPI
+            device_pixel_ratio: Device pixel ratio of the presentation screen
+            dpi: Fallback resolution when no target size is known
+            max_entries: Number of slides kept in the cache
+            max_bytes: Pixel memory budget of each cache
+        """
+        advise_readahead(pdf_path)
         self.doc = fitz.open(pdf_path)
+        try:
+            self.disk_cache = DiskCache(pdf_path)
+        except OSError:
+            self.disk_cache = None
+        self.target_size = target_size
+        self.device_pixel_ratio = device_pixel_ratio
         self.dpi = dpi
-        self.fullscreen_dpi = fullscreen_dpi
-        self.cache = {}
-        self.fullscreen_cache = {}
+        self.cache = OrderedDict()
+        self.thumbnails = OrderedDict()
+        self.prefetched = OrderedDict()
+        self.lock = threading.Lock()
+        # Guards prefetched, rendering and generation
+        self.prefetch_lock = threading.Lock()
+        # Keys being prefetched, each with an Event set when it is done
+        self.rendering = {}
+        # Bumped when the target size changes, so older renders are discarded
+        self.generation = 0
         self.total_slides = len(self.doc)
+        if max_entries is None:
+            max_entries = max(8, min(32, self.total_slides))
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # Drop whatever MuPDF kept from a previously opened document
+        fitz.TOOLS.store_shrink(100)
     
-    def get_slide(self, page_num, high_res=False):
-        """Get slide as QPixmap, cache if not already cached
+    def set_target_size(self, target_size, device_pixel_ratio=1.0):
+        """Change the output resolution, dropping slides rendered for the old one"""
+        if (target_size, device_pixel_ratio) == (self.target_size, self.device_pixel_ratio):
+            return
+        with self.prefetch_lock:
+            self.target_size = target_size
+            self.device_pixel_ratio = device_pixel_ratio
+            self.generation += 1
+            self.prefetched.clear()
+        self.cache.clear()
+    
+    def _variant(self, box):
+        """Name of a render size in the disk cache"""
+        return f"{box[0]}x{box[1]}" if box else f"{self.dpi}dpi"
+    
+    def remove_sizes(self, boxes):
+        """Delete the disk cache images of render sizes no longer used
         
-        Args:
-            page_num: Page number to retrieve
-            high_res: If True, use higher DPI for fullscreen display
+        The presentation size is always kept.
         """
-        target_dpi = self.fullscreen_dpi if high_res else self.dpi
-        cache = self.fullscreen_cache if high_res else self.cache
-        
-        if page_num not in cache:
+        if not self.disk_cache:
+            return
+        keep = self._variant(self.target_size)
+        for box in boxes:
+            variant = self._variant(box)
+            if variant != keep:
+                self.disk_cache.remove_variant(variant)
+    
+    def _render(self, page_num, box=None, background_store=True):
+        """Render a page to a QImage, or return None if the document is closed
+        
+        The page is fitted into box, a (width, height) in pixels, which
+        defaults to the presentation screen. The image is returned in Qt's
+        native 32-bit layout, so that the conversion happens here (usually
+        on the prefetch worker) and QPixmap.fromImage() on the GUI thread is
+        a plain copy. Pages rendered in an earlier run are read from the
+        disk cache instead. Only the MuPDF calls hold self.lock.
+        """
+        box = box or self.target_size
+        variant = self._variant(box)
+        if self.disk_cache:
+            image = self.disk_cache.load(page_num, variant)
+            if image is not None:
+                return image
+        
+        with self.lock:
+            if self.doc.is_closed:
+                return None
             page = self.doc[page_num]
-            mat = fitz.Matrix(target_dpi / 72, target_dpi / 72)
-            pix = page.get_pixmap(matrix=mat)
-            
-            # Convert to QImage
+            if box:
+                width, height = box
+                zoom = min(width / page.rect.width, height / page.rect.height)
+            else:
+                zoom = self.dpi / 72
+            # Slides are opaque; the RGB888 QImage below relies on 3 bytes/pixel
+            pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), colorspace=fitz.csRGB, alpha=False)
+        
+        # Convert to QImage
+        if hasattr(pix, 'samples_ptr'):
+            img_data = sip.voidptr(pix.samples_ptr, pix.stride * pix.height)
+        else:
+            # PyMuPDF < 1.20: fall back to a bytes copy of the samples
             img_data = pix.samples
-            qimg = QImage(img_data, pix.width, pix.height, 
-                         pix.stride, QImage.Format.Format_RGB888)
-            cache[page_num] = QPixmap.fromImage(qimg)
+        qimg = QImage(img_data, pix.width, pix.height, 
+                     pix.stride, QImage.Format.Format_RGB888)
+        # The converted image owns its data, so pix may be freed afterwards
+        image = qimg.convertToFormat(QImage.Format.Format_RGB32)
+        del qimg, img_data
+        with self.lock:
+            # Freeing goes through MuPDF's context as well
+            del pix
+        if self.disk_cache:
+            self.disk_cache.store(page_num, variant, image, background_store)
+        return image
+    
+    def is_cached(self, page_num, box=None):
+        """Check whether a slide (or a thumbnail fitting box) is ready to show"""
+        if box is None:
+            return page_num in self.cache
+        return (page_num, *box) in self.thumbnails
+    
+    def is_rendered(self, page_num, box=None):
+        """Check whether a slide can be shown without waiting for MuPDF"""
+        if self.is_cached(page_num, box):
+            return True
+        key = page_num if box is None else (page_num, *box)
+        with self.prefetch_lock:
+            return key in self.prefetched
+    
+    def _evict(self, cache):
+        """Drop least recently used entries beyond the entry and byte budget
+        
+        Works for QPixmaps and QImages alike. The newest entry always stays,
+        even if a single slide exceeds the budget.
+        """
+        def size(image):
+            return image.width() * image.height() * image.depth() // 8
         
-        return cache[page_num]
+        total = sum(size(image) for image in cache.values())
+        while len(cache) > 1 and (len(cache) > self.max_entries or total > self.max_bytes):
+            _, image = cache.popitem(last=False)
+            total -= size(image)
     
-    def close(self):
-        self.doc.close()
+    def _take_prefetched(self, key):
+        """Pop a prefetched image, waiting if a worker is rendering exactly it"""
+        with self.prefetch_lock:
+            done = self.rendering.get(key)
+        if done:
+            done.wait()
+        with self.prefetch_lock:
+            return self.prefetched.pop(key, None)
+    
+    def get_slide(self, page_num):
+        """Get slide as QPixmap, cache if not already cached
+        
+        Must be called from the GUI thread.
+        """
+        if page_num in self.cache:
+            self.cache.move_to_end(page_num)
+            return self.cache[page_num]
+        
+        qimg = self._take_prefetched(page_num)
+        if qimg is None:
+            qimg = self._render(page_num)
+        pixmap = QPixmap.fromImage(qimg)
+        # Shown at its device pixels, not stretched by the screen's scaling
+        pixmap.setDevicePixelRatio(self.device_pixel_ratio)
+        self.cache[page_num] = pixmap
+        
+        self._evict(self.cache)
+        return self.cache[page_num]
+    
+    def get_thumbnail(self, page_num, box, device_pixel_ratio=1.0):
+        """Get slide rendered by MuPDF to fit a small box, e.g. a preview pane
+        
+        box is a (width, height) tuple in device pixels. Avoids
+        smooth-scaling a full-resolution slide down to a thumbnail.
+        Must be called from the GUI thread.
+        """
+        key = (page_num, *box)
+        if key in self.thumbnails:
+            self.thumbnails.move_to_end(key)
+            return self.thumbnails[key]
+        
+        qimg = self._take_prefetched(key)
+        if qimg is None:
+            qimg = self._render(page_num, box)
+        pixmap = QPixmap.fromImage(qimg)
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        self.thumbnails[key] = pixmap
+        
+        self._evict(self.thumbnails)
+        return self.thumbnails[key]
+    
+    def prefetch(self, page_num, box=None):
+        """Render a slide ahead of time (safe to call from worker threads)
+        
+        With box, a (width, height) tuple, the thumbnail for get_thumbnail()
+        is rendered instead of the full slide. QPixmaps may only be created
+        on the GUI thread, so the rendered QImage is parked until
+        get_slide() or get_thumbnail() picks it up.
+        """
+        key = page_num if box is None else (page_num, *box)
+        with self.prefetch_lock:
+            if key in self.prefetched or key in self.rendering:
+                return
+            done = self.rendering[key] = threading.Event()
+            generation = self.generation
+        
+        try:
+            image = self._render(page_num, box)
+            with self.prefetch_lock:
+                if image is not None and generation == self.generation:
+                    self.prefetched[key] = image
+                    self._evict(self.prefetched)
+        finally:
+            with self.prefetch_lock:
+                del self.rendering[key]
+            done.set()
+    
+    def prerender(self, page_num, box):
+        """Render a slide into the disk cache only (safe to call from worker threads)
+        
+        Unlike prefetch(), nothing is kept in memory: the image is written
+        on the calling thread, so a whole deck never queues up for writing.
+        Returns False if there is no disk cache or the document has been
+        closed.
+        """
+        if not self.disk_cache or self.doc.is_closed:
+            return False
+        if self.disk_cache.contains(page_num, self._variant(box)):
+            return True
+        return self._render(page_num, box, background_store=False) is not None
+    
+    def close(self, background=False):
+        """Release the document and all rendered slides (GUI thread)
+        
+        Closing has to wait for a render still running on a prefetch worker.
+        With background, that wait and the MuPDF teardown happen on a helper
+        thread instead, so the caller returns immediately.
+        """
         self.cache.clear()
-        self.fullscreen_cache.clear()
+        self.thumbnails.clear()
+        if background:
+            threading.Thread(target=self._close_document, daemon=True).start()
+        else:
+            self._close_document()
+    
+    def _close_document(self):
+        with self.lock:
+            self.doc.close()
+        with self.prefetch_lock:
+            self.prefetched.clear()
+        # Release MuPDF's internal font/image store
+        fitz.TOOLS.store_shrink(100)
+
+
+class RenderNotifier(QObject):
+    """Reports finished background renders to the GUI thread"""
+    rendered = pyqtSignal(object, int, object)  # slide_cache, page_num, box
+
+
+class SlidePrefetcher(QRunnable):
+    """Background task rendering a single slide into a SlideCache
+    
+    If a RenderNotifier is given, its rendered signal is emitted once the
+    image is ready; the queued connection delivers it on the GUI thread.
+    """
+    def __init__(self, slide_cache, page_num, box=None, notifier=None):
+        super().__init__()
+        self.slide_cache = slide_cache
+        self.page_num = page_num
+        self.box = box
+        self.notifier = notifier
+    
+    def run(self):
+        self.slide_cache.prefetch(self.page_num, self.box)
+        if self.notifier:
+            self.notifier.rendered.emit(self.slide_cache, self.page_num, self.box)
+
+
+class SlidePrerenderer(QRunnable):
+    """Background task filling the disk cache with every slide of a document
+    
+    Renders one slide at a time, so the cache lock is never held for long
+    and navigation only waits for a single small render. Stops as soon as
+    cancelled is set.
+    """
+    def __init__(self, slide_cache, boxes, cancelled):
+        super().__init__()
+        self.slide_cache = slide_cache
+        self.boxes = boxes
+        self.cancelled = cancelled
+    
+    def run(self):
+        for page_num in range(self.slide_cache.total_slides):
+            for box in self.boxes:
+                if self.cancelled.is_set() or not self.slide_cache.prerender(page_num, box):
+                    return
 
 
 class NotesLoader:
     """Load and parse notes from text file"""
+    # Slide separator: either --- (next slide) or --N-- (slide N, 1-indexed)
+    MARKER_RE = re.compile(r'---|--(\d+)--')
+    
     def __init__(self, notes_path):
         self.notes = {}
-        if notes_path and Path(notes_path).exists():
-            self._parse_notes(notes_path)
+        if notes_path:
+            notes_path = Path(notes_path)
+            if notes_path.exists():
+                self._parse_notes(notes_path)
     
     def _parse_notes(self, notes_path):
-        # List of encodings to try, from most common to less common
-        encodings_to_try = [
-            'utf-8',      # Most common modern encoding
-            'latin-1',    # Windows Western European 
-            'cp1252',     # Windows default for Western European languages
-            'iso-8859-1'  # Another Western European encoding
-        ]
-        
-        content = None
-        for encoding in encodings_to_try:
-            try:
-                with open(notes_path, 'r', encoding=encoding) as f:
-                    content = f.read()
-                    print(f"Successfully read note file with {encoding} encoding")
-                    break
-            except UnicodeDecodeError:
-                continue
-        
-        # If no encoding worked, use replacement strategy
-        if content is None:
-            try:
-                with open(notes_path, 'r', encoding='utf-8', errors='replace') as f:
-                    content = f.read()
-                    print("Fell back to replacement strategy")
-            except Exception as e:
-                print(f"Could not read file {notes_path}: {e}")
-                return
+        try:
+            raw = notes_path.read_bytes()
+        except OSError as e:
+            print(f"Could not read file {notes_path}: {e}")
+            return
         
-        # Split by both --- and --N-- markers while capturing them
-        parts = re.split(r'(---|--\d+--)', content)
+        content = self._decode(raw)
         
         current_slide = 0
+        text_start = 0
         
-        for part in parts:
-            part_stripped = part.strip()
-            
-            if not part_stripped:
-                continue
+        for marker in self.MARKER_RE.finditer(content):
+            # Text between the previous marker and this one
+            self._add_note(current_slide, content[text_start:marker.start()])
+            text_start = marker.end()
             
-            # Check if it's a separator marker (---)
-            if part_stripped == '---':
-                current_slide += 1
-            # Check if it's a numbered marker (--N--)
-            elif re.match(r'^--(\d+)--$', part_stripped):
-                match = re.match(r'^--(\d+)--$', part_stripped)
-                current_slide = int(match.group(1)) - 1  # 0-indexed
+            if marker.group(1):
+                current_slide = int(marker.group(1)) - 1  # 0-indexed
             else:
-                # It's text content - assign to current_slide
-                self.notes[current_slide] = part_stripped
+                current_slide += 1
+        
+        self._add_note(current_slide, content[text_start:])
+    
+    @staticmethod
+    def _decode(raw):
+        """Decode the notes file contents, guessing the encoding"""
+        if raw.startswith(codecs.BOM_UTF8):
+            print("Successfully read note file with utf-8-sig encoding")
+            return raw.decode('utf-8-sig')
+        # Notepad's "Unicode" files; cp1252 would happily decode them to garbage
+        if raw.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+            try:
+                content = raw.decode('utf-16')
+                print("Successfully read note file with utf-16 encoding")
+                return content
+            except UnicodeDecodeError:
+                pass
+        
+        # UTF-8 first, then the Windows default for Western European languages
+        for encoding in ('utf-8', 'cp1252'):
+            try:
+                content = raw.decode(encoding)
+                print(f"Successfully read note file with {encoding} encoding")
+                return content
+            except UnicodeDecodeError:
+                continue
+        
+        print("Fell back to replacement strategy")
+        return raw.decode('utf-8', errors='replace')
+    
+    def _add_note(self, slide_num, text):
+        """Assign text to a slide unless it is blank"""
+        text = text.strip()
+        if text:
+            self.notes[slide_num] = text
     
     def get_notes(self, slide_num):
         return self.notes.get(slide_num, "")
 
 
+class PointerOverlay(QWidget):
+    """Translucent widget showing the laser pointer above the slide
+    
+    Moving the pointer just moves this small widget; the slide pixmap
+    underneath is never recomposited.
+    """
+    SIZE = 80
+    
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.setStyleSheet("background: transparent;")
+        self.setFixedSize(self.SIZE, self.SIZE)
+        self._pointer_pixmap = self._build_pointer_pixmap()
+        self.hide()
+    
+    def _build_pointer_pixmap(self):
+        """Rasterize the pointer gradients once"""
+        image = QImage(self.SIZE, self.SIZE, QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(image)
+        self._draw_laser_pointer(painter, QPoint(self.SIZE // 2, self.SIZE // 2))
+        painter.end()
+        return QPixmap.fromImage(image)
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._pointer_pixmap)
+        painter.end()
+    
+    def _draw_laser_pointer(self, painter, pos):
+        """Draw a laser pointer at the given position"""
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        gradient = QRadialGradient(QPointF(pos.x(), pos.y()), 30)
+        gradient.setColorAt(0, QColor(255, 0, 0, 200))
+        gradient.setColorAt(0.3, QColor(255, 50, 0, 150))
+        gradient.setColorAt(0.6, QColor(255, 100, 0, 80))
+        gradient.setColorAt(1, QColor(255, 150, 0, 0))
+        
+        painter.setBrush(gradient)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.drawEllipse(QPointF(pos.x(), pos.y()), 30, 30)
+        
+        center_gradient = QRadialGradient(QPointF(pos.x(), pos.y()), 15)
+        center_gradient.setColorAt(0, QColor(255, 255, 255, 255))
+        center_gradient.setColorAt(0.5, QColor(255, 0, 0, 255))
+        center_gradient.setColorAt(1, QColor(200, 0, 0, 200))
+        
+        painter.setBrush(center_gradient)
+        painter.drawEllipse(QPointF(pos.x(), pos.y()), 15, 15)
+
+
 class FullScreenWindow(QMainWindow):
     """Fullscreen window for audience display"""
     def __init__(self, presenter_window=None):
@@ -278,10 +898,17 @@ class FullScreenWindow(QMainWindow):
         self.slide_label = QLabel()
         self.slide_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.slide_label.setStyleSheet("background-color: black;")
+        # The pixmap is fitted to the label, not the other way round
+        self.slide_label.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Ignored)
         layout.addWidget(self.slide_label)
         
+        self.pointer_overlay = PointerOverlay(self.slide_label)
+        
         self.is_blanked = False
         self.current_pixmap = None
+        self._scaled = None
+        # (pixmap cacheKey, width, height) of what the label currently shows
+        self._render_key = None
         self.pointer_pos = None
     
     def show_slide(self, pixmap):
@@ -289,65 +916,59 @@ class FullScreenWindow(QMainWindow):
         self.current_pixmap = pixmap
         if self.is_blanked:
             self.slide_label.clear()
+            self._render_key = None
             return
         self._update_display()
     
     def _update_display(self):
-        """Update the display with current slide and pointer"""
+        """Update the display with the current slide, scaled to the window"""
         if not self.current_pixmap or self.is_blanked:
             return
         
-        scaled = self.current_pixmap.scaled(self.size(), Qt.AspectRatioMode.KeepAspectRatio, 
-                                           Qt.TransformationMode.SmoothTransformation)
+        key = (self.current_pixmap.cacheKey(), self.width(), self.height())
+        if key == self._render_key:
+            return
         
-        if self.pointer_pos:
-            display_pixmap = QPixmap(scaled.size())
-            display_pixmap.fill(Qt.GlobalColor.black)
-            
-            painter = QPainter(display_pixmap)
-            painter.drawPixmap(0, 0, scaled)
-            self._draw_laser_pointer(painter, self.pointer_pos)
-            painter.end()
-            self.slide_label.setPixmap(display_pixmap)
-        else:
-            self.slide_label.setPixmap(scaled)
+        self._scaled = scale_pixmap(self.current_pixmap, self.size())
+        self.slide_label.setPixmap(self._scaled)
+        self._render_key = key
     
-    def _draw_laser_pointer(self, painter, pos):
-        """Draw a laser pointer at the given position"""
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        gradient = QRadialGradient(QPointF(pos.x(), pos.y()), 30)
-        gradient.setColorAt(0, QColor(255, 0, 0, 200))
-        gradient.setColorAt(0.3, QColor(255, 50, 0, 150))
-        gradient.setColorAt(0.6, QColor(255, 100, 0, 80))
-        gradient.setColorAt(1, QColor(255, 150, 0, 0))
-        
-        painter.setBrush(gradient)
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawEllipse(QPointF(pos.x(), pos.y()), 30, 30)
-        
-        center_gradient = QRadialGradient(QPointF(pos.x(), pos.y()), 15)
-        center_gradient.setColorAt(0, QColor(255, 255, 255, 255))
-        center_gradient.setColorAt(0.5, QColor(255, 0, 0, 255))
-        center_gradient.setColorAt(1, QColor(200, 0, 0, 200))
-        
-        painter.setBrush(center_gradient)
-        painter.drawEllipse(QPointF(pos.x(), pos.y()), 15, 15)
+    def resizeEvent(self, event):
+        """Rescale the slide for the new window size"""
+        super().resizeEvent(event)
+        self._update_display()
+        self.set_pointer_position(self.pointer_pos)
     
     def set_pointer_position(self, pos):
-        """Set laser pointer position (None to hide)"""
+        """Set laser pointer position in slide coordinates (None to hide)
+        
+        Coordinates are device-independent pixels of the displayed slide.
+        """
         self.pointer_pos = pos
-        self._update_display()
+        if pos is None or self.is_blanked or self._scaled is None:
+            self.pointer_overlay.hide()
+            return
+        
+        # The label centers the pixmap
+        scaled_size = self._scaled.deviceIndependentSize()
+        x_offset = int(self.slide_label.width() - scaled_size.width()) // 2
+        y_offset = int(self.slide_label.height() - scaled_size.height()) // 2
+        half = PointerOverlay.SIZE // 2
+        self.pointer_overlay.move(pos.x() + x_offset - half, pos.y() + y_offset - half)
+        self.pointer_overlay.show()
     
     def blank(self):
         """Blank the screen"""
         self.is_blanked = True
         self.slide_label.clear()
+        self._render_key = None
+        self.pointer_overlay.hide()
     
     def unblank(self):
         """Unblank the screen"""
         self.is_blanked = False
         self._update_display()
+        self.set_pointer_position(self.pointer_pos)
     
     def keyPressEvent(self, event):
         """Forward key events to presenter window"""
@@ -383,10 +1004,57 @@ class PresenterWindow(QMainWindow):
         self.is_presenting = False
         self.is_blanked = False
         self.start_time = None
-        
+        self._last_update_state = None
+        
+        # Enumerating monitors is a platform round-trip; keep the list and
+        # refresh it only when screens are plugged in or out
+        self._screens = QApplication.screens()
+        self._warned_single_screen = False
+        app = QApplication.instance()
+        app.screenAdded.connect(self._refresh_screens)
+        app.screenRemoved.connect(self._refresh_screens)
+        
+        # Single worker: MuPDF rendering is serialized by the cache lock anyway
+        self.prefetch_pool = QThreadPool()
+        self.prefetch_pool.setMaxThreadCount(1)
+        self.render_notifier = RenderNotifier()
+        self.render_notifier.rendered.connect(self._on_slide_rendered)
+        self._pending_thumbnail = None
+        # The prerender gets its own thread; on the global pool it would hold
+        # back disk cache writes and config saves until the whole deck is done
+        self.prerender_pool = QThreadPool()
+        self.prerender_pool.setMaxThreadCount(1)
+        self._prerender_key = None
+        self._prerender_cancelled = threading.Event()
+        # Document and pane sizes last prerendered, kept when cancelled
+        self._prerendered = (None, ())
+        
+        # Mouse moves arrive far more often than the screen refreshes
+        self._pending_pointer_pos = None
+        self._pointer_timer = QTimer()
+        self._pointer_timer.setSingleShot(True)
+        self._pointer_timer.setInterval(16)
+        self._pointer_timer.timeout.connect(self._flush_pointer)
+        
+        # Session state is written at most every 2 s, in the background, and on close
+        self._save_timer = QTimer()
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(2000)
+        self._save_timer.timeout.connect(lambda: self._flush_config(background=True))
+        
+        # Dragging the window edge resizes the panes many times a second;
+        # the slides are re-rendered at the new size once it has settled
+        self._resize_timer = QTimer()
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(50)
+        self._resize_timer.timeout.connect(self.update_slides)
+        self._resize_timer.timeout.connect(self._start_prerender)
+        
+        # Clock tick, re-armed by update_time() and only running while the
+        # window is visible (see showEvent/hideEvent)
         self.timer = QTimer()
+        self.timer.setSingleShot(True)
         self.timer.timeout.connect(self.update_time)
-        self.timer.start(1000)
         
         self._init_ui()
         self._load_last_session()
@@ -396,9 +1064,14 @@ class PresenterWindow(QMainWindow):
         
         QTimer.singleShot(100, self._move_to_primary_screen)
     
+    def _refresh_screens(self, screen=None):
+        """Update the cached screen list after a monitor change"""
+        self._screens = QApplication.screens()
+        self._warned_single_screen = False
+    
     def _move_to_primary_screen(self):
         """Move window to primary screen"""
-        screens = QApplication.screens()
+        screens = self._screens
         if screens:
             primary_screen = screens[0]
             geometry = primary_screen.availableGeometry()
@@ -489,6 +1162,10 @@ class PresenterWindow(QMainWindow):
         self.current_slide_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.current_slide_label.setMinimumSize(600, 450)
         self.current_slide_label.setStyleSheet("background-color: white;")
+        # Pixmaps are rendered to fit the label; letting their size feed back
+        # into the layout would re-layout the window on every slide change
+        # and keep it from shrinking
+        self.current_slide_label.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Ignored)
         self.current_slide_label.setMouseTracking(True)
         self.current_slide_label.mouseMoveEvent = self._handle_mouse_move
         
@@ -509,6 +1186,7 @@ class PresenterWindow(QMainWindow):
         self.next_slide_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.next_slide_label.setMinimumSize(300, 225)
         self.next_slide_label.setStyleSheet("background-color: white;")
+        self.next_slide_label.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Ignored)
         next_layout.addWidget(self.next_slide_label)
         next_layout.addStretch()
         
@@ -555,6 +1233,7 @@ class PresenterWindow(QMainWindow):
         """Event filter to detect mouse leaving the slide label"""
         if obj == self.current_slide_label and event.type() == event.Type.Leave:
             if self.is_presenting and self.fullscreen_window:
+                self._pointer_timer.stop()
                 self.fullscreen_window.set_pointer_position(None)
         return super().eventFilter(obj, event)
     
@@ -562,33 +1241,49 @@ class PresenterWindow(QMainWindow):
         """Handle mouse movement over current slide"""
         if not self.is_presenting or not self.fullscreen_window:
             return
+        # Mapping to the audience view waits for the flush, so the many
+        # moves between two frames cost nothing but this assignment
+        self._queue_pointer_position(event.pos())
+    
+    def _map_pointer_position(self, pos):
+        """Map a position on the current slide pane to audience slide coordinates
         
-        pos = event.pos()
-        
+        Returns None if pos is outside the slide.
+        """
         pixmap = self.current_slide_label.pixmap()
-        if not pixmap:
-            return
+        fullscreen_pixmap = self.fullscreen_window.slide_label.pixmap()
+        if not pixmap or not fullscreen_pixmap:
+            return None
         
         label_size = self.current_slide_label.size()
-        pixmap_size = pixmap.size()
+        pixmap_size = pixmap.deviceIndependentSize()
         
         x_offset = (label_size.width() - pixmap_size.width()) / 2
         y_offset = (label_size.height() - pixmap_size.height()) / 2
         
         if (pos.x() < x_offset or pos.x() > x_offset + pixmap_size.width() or
             pos.y() < y_offset or pos.y() > y_offset + pixmap_size.height()):
-            self.fullscreen_window.set_pointer_position(None)
-            return
+            return None
         
         rel_x = (pos.x() - x_offset) / pixmap_size.width()
         rel_y = (pos.y() - y_offset) / pixmap_size.height()
         
-        fullscreen_pixmap = self.fullscreen_window.slide_label.pixmap()
-        if fullscreen_pixmap:
-            fs_x = rel_x * fullscreen_pixmap.width()
-            fs_y = rel_y * fullscreen_pixmap.height()
-            
-            self.fullscreen_window.set_pointer_position(QPoint(int(fs_x), int(fs_y)))
+        fullscreen_size = fullscreen_pixmap.deviceIndependentSize()
+        fs_x = rel_x * fullscreen_size.width()
+        fs_y = rel_y * fullscreen_size.height()
+        return QPoint(int(fs_x), int(fs_y))
+    
+    def _queue_pointer_position(self, pos):
+        """Coalesce pointer updates to roughly the display refresh rate"""
+        self._pending_pointer_pos = pos
+        if not self._pointer_timer.isActive():
+            self._pointer_timer.start()
+    
+    def _flush_pointer(self):
+        """Send the latest queued pointer position to the audience view"""
+        if self.is_presenting and self.fullscreen_window:
+            self.fullscreen_window.set_pointer_position(
+                self._map_pointer_position(self._pending_pointer_pos))
     
     def _setup_shortcuts(self):
         """Setup keyboard shortcuts"""
@@ -662,7 +1357,7 @@ class PresenterWindow(QMainWindow):
     
     def open_pdf(self):
         """Open a PDF file"""
-        last_dir = self.config.get('Session', 'last_directory', fallback=str(Path.home()))
+        last_dir = self.config.get('Session', 'last_directory', fallback=self.config.home_dir)
         
         filename, _ = QFileDialog.getOpenFileName(
             self, "Open PDF", last_dir, "PDF Files (*.pdf)"
@@ -680,20 +1375,18 @@ class PresenterWindow(QMainWindow):
         """
         try:
             if self.slide_cache:
+                self._stop_prefetch()
                 self.slide_cache.close()
             
-            self.slide_cache = SlideCache(pdf_path)
+            target_size, ratio = self._presentation_pixel_size()
+            self.slide_cache = SlideCache(pdf_path, target_size, device_pixel_ratio=ratio)
             
-            self.config.set('Session', 'last_directory', str(Path(pdf_path).parent))
+            path = Path(pdf_path)
+            self.config.set('Session', 'last_directory', str(path.parent))
             self.config.set('Session', 'last_file', pdf_path)
             
-            notes_path = Path(pdf_path).with_name(
-                Path(pdf_path).stem + '_notes.txt'
-            )
-            if notes_path.exists():
-                self.notes_loader = NotesLoader(str(notes_path))
-            else:
-                self.notes_loader = NotesLoader(None)
+            # NotesLoader leaves the notes empty if the file does not exist
+            self.notes_loader = NotesLoader(path.with_name(path.stem + '_notes.txt'))
             
             # Restore last slide position if this is an auto-load
             if restore_slide:
@@ -707,15 +1400,13 @@ class PresenterWindow(QMainWindow):
                 # Manual load - start from beginning
                 self.current_slide = 0
             
-            self.preview_slide = self.current_slide + 1
-            if self.preview_slide >= self.slide_cache.total_slides:
-                self.preview_slide = self.slide_cache.total_slides - 1
+            self.preview_slide = self._clamp_preview(self.current_slide + 1)
             
             self.last_preview_before_updown = None
             self.last_preview_used = False            
             self.remembered_preview = None
             
-            self.file_label.setText(Path(pdf_path).name)
+            self.file_label.setText(path.name)
             self.start_btn.setEnabled(True)
             self.start_current_btn.setEnabled(True)
             self.prev_btn.setEnabled(True)
@@ -736,7 +1427,7 @@ class PresenterWindow(QMainWindow):
             QMessageBox.warning(self, "Warning", "Please load a PDF first")
             return
         
-        last_dir = self.config.get('Session', 'last_directory', fallback=str(Path.home()))
+        last_dir = self.config.get('Session', 'last_directory', fallback=self.config.home_dir)
         
         filename, _ = QFileDialog.getOpenFileName(
             self, "Open Notes File", last_dir, "Text Files (*.txt)"
@@ -758,23 +1449,37 @@ class PresenterWindow(QMainWindow):
         """Update slide display"""
         if not self.slide_cache:
             return
+        # Before the window is shown the panes don't have their real size
+        # yet; showEvent() triggers the first update
+        if not self.isVisible() and not self.is_presenting:
+            return
         
-        current_pixmap = self.slide_cache.get_slide(self.current_slide)
-        scaled_current = current_pixmap.scaled(
-            self.current_slide_label.size(), 
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
-        )
-        self.current_slide_label.setPixmap(scaled_current)
+        # Navigation at the first/last slide and repeated preview resets
+        # often leave everything as it is
+        state = (self.slide_cache, self.notes_loader, self.current_slide, self.preview_slide,
+                 self.is_presenting, self.current_slide_label.size(), self.next_slide_label.size(),
+                 self.devicePixelRatioF())
+        if state == self._last_update_state:
+            return
+        self._last_update_state = state
+        
+        # MuPDF rasterizes straight at the pane size, which is cheaper and
+        # sharper than smooth-scaling the full resolution slide
+        ratio = self.devicePixelRatioF()
+        current_pixmap = self.slide_cache.get_thumbnail(
+            self.current_slide, self._pane_box(self.current_slide_label), ratio)
+        set_label_pixmap(self.current_slide_label, current_pixmap)
         
+        self._pending_thumbnail = None
         if self.preview_slide < self.slide_cache.total_slides:
-            next_pixmap = self.slide_cache.get_slide(self.preview_slide)
-            scaled_next = next_pixmap.scaled(
-                self.next_slide_label.size(),
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
-            self.next_slide_label.setPixmap(scaled_next)
+            thumb_box = self._pane_box(self.next_slide_label)
+            if self.slide_cache.is_rendered(self.preview_slide, thumb_box):
+                next_pixmap = self.slide_cache.get_thumbnail(self.preview_slide, thumb_box, ratio)
+                set_label_pixmap(self.next_slide_label, next_pixmap)
+            else:
+                # Keep showing the old thumbnail while scrolling the preview;
+                # the worker renders the new one (see _on_slide_rendered)
+                self._pending_thumbnail = (self.preview_slide, thumb_box)
         else:
             self.next_slide_label.clear()
             self.next_slide_label.setText("End of presentation")
@@ -783,18 +1488,102 @@ class PresenterWindow(QMainWindow):
             f"Slide {self.current_slide + 1} / {self.slide_cache.total_slides} (Preview: {self.preview_slide + 1})"
         )
         
-        if self.notes_loader:
-            notes = self.notes_loader.get_notes(self.current_slide)
+        notes = self.notes_loader.get_notes(self.current_slide) if self.notes_loader else ""
+        # Moving only the preview must not re-layout the notes or reset their scrolling
+        if notes != self.notes_text.toPlainText():
             self.notes_text.setPlainText(notes)
-        else:
-            self.notes_text.setPlainText("")
         
         if self.is_presenting and self.fullscreen_window:
-            slide_pixmap = self.slide_cache.get_slide(self.current_slide, high_res=True)
-            self.fullscreen_window.show_slide(slide_pixmap)
+            # show_slide() ignores the pixmap when only the preview moved
+            self.fullscreen_window.show_slide(self.slide_cache.get_slide(self.current_slide))
         
         self.config.set('Session', 'last_slide', str(self.current_slide))
-        self.config.save()
+        # Restarting the timer coalesces a burst of navigation into one write
+        self._save_timer.start()
+        
+        self._prefetch_neighbors()
+    
+    def _prefetch_neighbors(self):
+        """Render the slides around the current one in the background"""
+        # Drop requests for slides we navigated away from
+        self.prefetch_pool.clear()
+        
+        if self._pending_thumbnail:
+            page_num, box = self._pending_thumbnail
+            self.prefetch_pool.start(
+                SlidePrefetcher(self.slide_cache, page_num, box, self.render_notifier), 1)
+        
+        # Full slides are only needed by the audience view, mostly ahead of
+        # the current one. Then the panes for going forward (preview becomes
+        # current, preview + 1 becomes next) and back (current - 1 and current)
+        current_box = self._pane_box(self.current_slide_label)
+        thumb_box = self._pane_box(self.next_slide_label)
+        wanted = []
+        if self.is_presenting:
+            wanted += [(self.preview_slide, None), (self.current_slide + 1, None),
+                       (self.current_slide + 2, None), (self.current_slide - 1, None),
+                       (self.current_slide + 3, None)]
+        wanted += [(self.preview_slide, current_box), (self.preview_slide + 1, thumb_box),
+                   (self.current_slide - 1, current_box), (self.current_slide, thumb_box)]
+        
+        for page_num, box in dict.fromkeys(wanted):
+            if 0 <= page_num < self.slide_cache.total_slides and not self.slide_cache.is_cached(page_num, box):
+                self.prefetch_pool.start(SlidePrefetcher(self.slide_cache, page_num, box))
+        
+        self._start_prerender()
+    
+    def _start_prerender(self):
+        """Render the panes of all slides in idle time
+        
+        Jumping anywhere in the deck (now or in a later session) is then a
+        disk read. Only runs once the window is shown at its real size, and
+        not while presenting, since MuPDF holds the GIL while rendering.
+        """
+        if not self.slide_cache:
+            return
+        if self.is_presenting or not self.isVisible():
+            self._cancel_prerender()
+            return
+        
+        boxes = (self._pane_box(self.current_slide_label), self._pane_box(self.next_slide_label))
+        prerender_key = (self.slide_cache, boxes)
+        if prerender_key == self._prerender_key:
+            return
+        self._cancel_prerender()
+        old_cache, old_boxes = self._prerendered
+        if old_cache is self.slide_cache:
+            # The window was resized; the old pane sizes would only pile up on disk
+            self.slide_cache.remove_sizes(set(old_boxes) - set(boxes))
+        self._prerender_key = self._prerendered = prerender_key
+        self.prerender_pool.start(SlidePrerenderer(self.slide_cache, boxes, self._prerender_cancelled))
+    
+    def _cancel_prerender(self):
+        """Stop filling the disk cache for the old document or pane sizes"""
+        self._prerender_cancelled.set()
+        self._prerender_cancelled = threading.Event()
+        self._prerender_key = None
+    
+    def _on_slide_rendered(self, slide_cache, page_num, box):
+        """Show a Next Slide thumbnail rendered in the background"""
+        if (slide_cache is self.slide_cache and self._pending_thumbnail == (page_num, box)):
+            self._pending_thumbnail = None
+            set_label_pixmap(self.next_slide_label,
+                             self.slide_cache.get_thumbnail(page_num, box, self.devicePixelRatioF()))
+    
+    def _pane_box(self, label):
+        """Render size of a presenter pane in device pixels"""
+        ratio = self.devicePixelRatioF()
+        return (round(label.width() * ratio), round(label.height() * ratio))
+    
+    def _stop_prefetch(self):
+        """Cancel pending prefetches and wait for the running one"""
+        self._cancel_prerender()
+        self.prefetch_pool.clear()
+        self.prefetch_pool.waitForDone()
+    
+    def _clamp_preview(self, slide):
+        """Limit a preview slide number to the slides of the document"""
+        return max(0, min(slide, self.slide_cache.total_slides - 1))
     
     def next_slide(self):
         """Go to next slide"""
@@ -807,9 +1596,7 @@ class PresenterWindow(QMainWindow):
             
             self.current_slide = self.preview_slide
             
-            self.preview_slide = self.current_slide + 1
-            if self.preview_slide >= self.slide_cache.total_slides:
-                self.preview_slide = self.slide_cache.total_slides - 1
+            self.preview_slide = self._clamp_preview(self.current_slide + 1)
             
             self.update_slides()
     
@@ -817,9 +1604,7 @@ class PresenterWindow(QMainWindow):
         """Go to previous slide"""
         if self.slide_cache and self.current_slide > 0:
             self.current_slide -= 1
-            self.preview_slide = self.current_slide + 1
-            if self.preview_slide >= self.slide_cache.total_slides:
-                self.preview_slide = self.slide_cache.total_slides - 1
+            self.preview_slide = self._clamp_preview(self.current_slide + 1)
             self.update_slides()
     
     def preview_next(self):
@@ -844,17 +1629,13 @@ class PresenterWindow(QMainWindow):
     def preview_set_next(self):
         """Set preview to current slide + 1 (key 1)"""
         if self.slide_cache:
-            self.preview_slide = self.current_slide + 1
-            if self.preview_slide >= self.slide_cache.total_slides:
-                self.preview_slide = self.slide_cache.total_slides - 1
+            self.preview_slide = self._clamp_preview(self.current_slide + 1)
             self.update_slides()
     
     def preview_set_prev(self):
         """Set preview to current slide - 1 (key 9)"""
         if self.slide_cache:
-            self.preview_slide = self.current_slide - 1
-            if self.preview_slide < 0:
-                self.preview_slide = 0
+            self.preview_slide = self._clamp_preview(self.current_slide - 1)
             self.update_slides()
     
     def preview_remember(self):
@@ -873,7 +1654,7 @@ class PresenterWindow(QMainWindow):
         if not self.slide_cache:
             return
         self.current_slide = 0
-        self.preview_slide = 1
+        self.preview_slide = self._clamp_preview(1)
         self.update_slides()
         self._start_presentation()
     
@@ -883,19 +1664,41 @@ class PresenterWindow(QMainWindow):
             return
         self._start_presentation()
     
+    def _presentation_screen(self):
+        """Screen the audience view is shown on (secondary if available)"""
+        screens = self._screens
+        if len(screens) < 2:
+            return screens[0] if screens else None
+        return screens[1]
+    
+    def _presentation_pixel_size(self):
+        """Size of the presentation screen in device pixels, and its pixel ratio"""
+        screen = self._presentation_screen()
+        if not screen:
+            return None, 1.0
+        size = screen.geometry().size()
+        ratio = screen.devicePixelRatio()
+        return (round(size.width() * ratio), round(size.height() * ratio)), ratio
+    
     def _start_presentation(self):
         """Initialize and show fullscreen window"""
-        screens = QApplication.screens()
+        screens = self._screens
         if screens:
             primary_screen = screens[0]
             geometry = primary_screen.availableGeometry()
-            self.move(geometry.center() - self.rect().center())
+            position = geometry.center() - self.rect().center()
+            # Presenting again from the same layout needs no window move
+            if self.pos() != position:
+                self.move(position)
         
         if len(screens) < 2:
-            QMessageBox.warning(
-                self, "Warning", 
-                "No secondary display detected. Presentation will open on primary screen."
-            )
+            # Once per monitor setup is enough when starting and stopping repeatedly
+            if not self._warned_single_screen:
+                QMessageBox.warning(
+                    self, "Warning", 
+                    "No secondary display detected. Presentation will open on primary screen."
+                )
+                self._warned_single_screen = True
             target_screen = screens[0]
         else:
             target_screen = screens[1]
@@ -907,23 +1710,32 @@ class PresenterWindow(QMainWindow):
         self.fullscreen_window.setGeometry(geometry)
         self.fullscreen_window.showFullScreen()
         
-        slide_pixmap = self.slide_cache.get_slide(self.current_slide, high_res=True)
+        # Screens may have been (un)plugged since the PDF was loaded
+        self._stop_prefetch()
+        self.slide_cache.set_target_size(*self._presentation_pixel_size())
+        slide_pixmap = self.slide_cache.get_slide(self.current_slide)
         self.fullscreen_window.show_slide(slide_pixmap)
         
         self.is_presenting = True
         self.is_blanked = False
-        self.start_time = datetime.now()
+        # Monotonic, so clock adjustments don't change the duration
+        self.start_time = time.monotonic()
+        self._prefetch_neighbors()
         
-        self.stop_btn.setEnabled(True)
-        self.blank_btn.setEnabled(True)
-        self.start_btn.setEnabled(False)
-        self.start_current_btn.setEnabled(False)
+        self._set_presenting_buttons(True)
         
+        # Let the audience window paint first; taking focus back costs a
+        # round-trip to the window manager
+        QTimer.singleShot(0, self._focus_presenter)
+    
+    def _focus_presenter(self):
+        """Bring the presenter window back to the front for keyboard input"""
         self.activateWindow()
         self.raise_()
     
     def stop_presenting(self):
         """Stop presentation and close fullscreen window"""
+        self._pointer_timer.stop()
         if self.fullscreen_window:
             self.fullscreen_window.close()
         
@@ -931,11 +1743,17 @@ class PresenterWindow(QMainWindow):
         self.is_blanked = False
         self.start_time = None
         
-        self.stop_btn.setEnabled(False)
-        self.blank_btn.setEnabled(False)
-        self.start_btn.setEnabled(True)
-        self.start_current_btn.setEnabled(True)
+        self._set_presenting_buttons(False)
         self.duration_label.setText("Duration: --:--")
+        # Resumes the prerendering paused while presenting
+        self.update_slides()
+    
+    def _set_presenting_buttons(self, presenting):
+        """Enable the buttons that apply while (not) presenting"""
+        self.stop_btn.setEnabled(presenting)
+        self.blank_btn.setEnabled(presenting)
+        self.start_btn.setEnabled(not presenting)
+        self.start_current_btn.setEnabled(not presenting)
     
     def toggle_blank(self):
         """Toggle screen blanking"""
@@ -947,20 +1765,36 @@ class PresenterWindow(QMainWindow):
         if self.is_blanked:
             self.fullscreen_window.blank()
         else:
+            # show_slide() kept the current slide while blanked
             self.fullscreen_window.unblank()
-            slide_pixmap = self.slide_cache.get_slide(self.current_slide, high_res=True)
-            self.fullscreen_window.show_slide(slide_pixmap)
     
     def update_time(self):
         """Update time display"""
-        current_time = datetime.now().strftime("%H:%M:%S")
-        self.time_label.setText(f"Time: {current_time}")
+        now = datetime.now()
+        set_label_text(self.time_label, f"Time: {now:%H:%M:%S}")
         
         if self.start_time:
-            duration = datetime.now() - self.start_time
-            minutes = int(duration.total_seconds() // 60)
-            seconds = int(duration.total_seconds() % 60)
-            self.duration_label.setText(f"Duration: {minutes:02d}:{seconds:02d}")
+            minutes, seconds = divmod(int(time.monotonic() - self.start_time), 60)
+            set_label_text(self.duration_label, f"Duration: {minutes:02d}:{seconds:02d}")
+        
+        # Fire again just after the next full second so the clock never lags
+        self.timer.start(1000 - now.microsecond // 1000)
+    
+    def resizeEvent(self, event):
+        """Re-render the slide panes for the new size (debounced)"""
+        super().resizeEvent(event)
+        self._resize_timer.start()
+    
+    def showEvent(self, event):
+        """Resume the clock and start prerendering when the window becomes visible"""
+        super().showEvent(event)
+        self.update_time()
+        self._resize_timer.start()
+    
+    def hideEvent(self, event):
+        """Pause the clock while nobody can see it"""
+        super().hideEvent(event)
+        self.timer.stop()
     
     def _load_last_session(self):
         """Load last session from config"""
@@ -969,12 +1803,22 @@ class PresenterWindow(QMainWindow):
             # Pass restore_slide=True for automatic session restore
             self._load_pdf(last_file, restore_slide=True)
     
+    def _flush_config(self, background=False):
+        """Write pending session changes to disk"""
+        self._save_timer.stop()
+        self.config.save(background=background)
+    
     def closeEvent(self, event):
         """Handle window close"""
+        self._flush_config()
         if self.fullscreen_window:
             self.fullscreen_window.close()
         if self.slide_cache:
-            self.slide_cache.close()
+            # Drop queued renders, but don't keep the window open for the
+            # one that is running
+            self._cancel_prerender()
+            self.prefetch_pool.clear()
+            self.slide_cache.close(background=True)
         event.accept()
 
 
@@ -985,9 +1829,13 @@ def main():
     parser.add_argument('notes_file', nargs='?', help='Notes file to load (optional)')
     args = parser.parse_args()
     
+    import_pymupdf()
+    
     # Initialize application
     app = QApplication(sys.argv)
     app.setApplicationName("PDF Show and Tell")
+    # Room for the scaled slides of several window sizes (in KB)
+    QPixmapCache.setCacheLimit(256 * 1024)
 
     # Create main window
     window = PresenterWindow()